@@ -530,11 +530,12 @@ class BrandIntelligenceOrchestrator:
             "brands_by_segment": {}
         }
         
-        # Add segment breakdown
+        # Add segment breakdown (materialize collected brand names once for membership tests)
+        collected_brands = set(self.results)
         for segment in self.market.get_all_segments():
             segment_brands = self.market.get_segment_brands(segment)
             if segment_brands:
-                collected = [b for b in segment_brands if b in self.results]
+                collected = [b for b in segment_brands if b in collected_brands]
                 summary["brands_by_segment"][segment] = {
                     "total": len(segment_brands),
                     "collected": len(collected),
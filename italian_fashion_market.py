@@ -12,6 +12,8 @@ Phase 2 of ModaMesh: Market Intelligence Foundation
 
 import json
 import logging
+from collections import Counter
+import numpy as np
 from pathlib import Path
 from typing import List, Dict, Optional, Any
 from dataclasses import dataclass
@@ -20,9 +22,9 @@ from dataclasses import dataclass
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(frozen=True)
 class SegmentCharacteristics:
-    """Data class for segment characteristics"""
+    """Data class for segment characteristics (frozen: one shared instance per segment)"""
     segment_name: str
     definition: str
     functionality_score: float
@@ -74,14 +76,45 @@ class ItalianFashionMarket:
         self.brand_to_segments = {}
         
         for segment_name, segment_data in self.market_data.items():
-            brands = segment_data.get('brands', [])
-            for brand in brands:
-                if brand not in self.brand_to_segments:
-                    self.brand_to_segments[brand] = []
-                self.brand_to_segments[brand].append(segment_name)
+            for brand in segment_data.get('brands', []):
+                self.brand_to_segments.setdefault(brand, []).append(segment_name)
+        
+        # Segment characteristics built once and shared by every brand and segment query
+        self._segment_cache = {
+            segment_name: SegmentCharacteristics(
+                segment_name=segment_name,
+                definition=segment_data['definition'],
+                functionality_score=segment_data['functionality_score'],
+                fashion_score=segment_data['fashion_score'],
+                brand_count=len(segment_data['brands'])
+            )
+            for segment_name, segment_data in self.market_data.items()
+        }
+        
+        # Average positioning per brand as parallel arrays (sorted brand order) for vectorized similarity queries
+        self._brand_names = tuple(sorted(self.brand_to_segments))
+        self._brand_positions = {brand: i for i, brand in enumerate(self._brand_names)}
+        self._brand_functionality = np.array([
+            self._average_score(brand, 'functionality_score') for brand in self._brand_names
+        ])
+        self._brand_fashion = np.array([
+            self._average_score(brand, 'fashion_score') for brand in self._brand_names
+        ])
+        self._brand_segment_sets = [frozenset(self.brand_to_segments[brand]) for brand in self._brand_names]
+        
+        # Sorted brand lists per segment, returned as copies by get_segment_brands
+        self._sorted_segment_brands = {
+            segment_name: tuple(sorted(segment_data['brands']))
+            for segment_name, segment_data in self.market_data.items()
+        }
         
         logger.info(f"✅ Built brand index for {len(self.brand_to_segments)} unique brands")
     
+    def _average_score(self, brand_name: str, score_field: str) -> float:
+        """Average a segment score over all segments of a brand"""
+        segments = self.brand_to_segments[brand_name]
+        return sum(getattr(self._segment_cache[segment], score_field) for segment in segments) / len(segments)
+    
     def get_all_brands(self) -> List[str]:
         """
         Get all brands in the Italian fashion market
@@ -89,7 +122,7 @@ class ItalianFashionMarket:
         Returns:
             List[str]: Sorted list of all unique brands
         """
-        return sorted(list(self.brand_to_segments.keys()))
+        return list(self._brand_names)
     
     def get_brand_segments(self, brand_name: str) -> Optional[BrandSegmentInfo]:
         """
@@ -105,21 +138,9 @@ class ItalianFashionMarket:
             logger.warning(f"⚠️  Brand '{brand_name}' not found in market data")
             return None
         
-        segment_characteristics = []
-        for segment_name in self.brand_to_segments[brand_name]:
-            segment_data = self.market_data[segment_name]
-            characteristics = SegmentCharacteristics(
-                segment_name=segment_name,
-                definition=segment_data['definition'],
-                functionality_score=segment_data['functionality_score'],
-                fashion_score=segment_data['fashion_score'],
-                brand_count=len(segment_data['brands'])
-            )
-            segment_characteristics.append(characteristics)
-        
         return BrandSegmentInfo(
             brand_name=brand_name,
-            segments=segment_characteristics
+            segments=[self._segment_cache[segment_name] for segment_name in self.brand_to_segments[brand_name]]
         )
     
     def get_segment_characteristics(self, segment_name: str) -> Optional[SegmentCharacteristics]:
@@ -132,18 +153,11 @@ class ItalianFashionMarket:
         Returns:
             Optional[SegmentCharacteristics]: Segment characteristics or None if segment not found
         """
-        if segment_name not in self.market_data:
+        if segment_name not in self._segment_cache:
             logger.warning(f"⚠️  Segment '{segment_name}' not found in market data")
             return None
         
-        segment_data = self.market_data[segment_name]
-        return SegmentCharacteristics(
-            segment_name=segment_name,
-            definition=segment_data['definition'],
-            functionality_score=segment_data['functionality_score'],
-            fashion_score=segment_data['fashion_score'],
-            brand_count=len(segment_data['brands'])
-        )
+        return self._segment_cache[segment_name]
     
     def get_segment_brands(self, segment_name: str) -> Optional[List[str]]:
         """
@@ -159,7 +173,7 @@ class ItalianFashionMarket:
             logger.warning(f"⚠️  Segment '{segment_name}' not found in market data")
             return None
         
-        return sorted(self.market_data[segment_name]['brands'])
+        return list(self._sorted_segment_brands[segment_name])
     
     def get_all_segments(self) -> List[str]:
         """
@@ -195,12 +209,7 @@ class ItalianFashionMarket:
         segment_stats.sort(key=lambda x: x['functionality_score'] + x['fashion_score'], reverse=True)
         
         # Brand distribution analysis
-        brand_distribution = {}
-        for brand, segments in self.brand_to_segments.items():
-            segment_count = len(segments)
-            if segment_count not in brand_distribution:
-                brand_distribution[segment_count] = 0
-            brand_distribution[segment_count] += 1
+        brand_distribution = dict(Counter(len(segments) for segments in self.brand_to_segments.values()))
         
         return {
             'total_brands': total_brands,
@@ -226,49 +235,38 @@ class ItalianFashionMarket:
         Returns:
             List[Dict[str, Any]]: List of similar brands with similarity metrics
         """
-        target_info = self.get_brand_segments(target_brand)
-        if not target_info:
+        if target_brand not in self._brand_positions:
+            logger.warning(f"⚠️  Brand '{target_brand}' not found in market data")
             return []
         
-        # Calculate average scores for target brand
-        target_func_avg = sum(s.functionality_score for s in target_info.segments) / len(target_info.segments)
-        target_fashion_avg = sum(s.fashion_score for s in target_info.segments) / len(target_info.segments)
+        # Compare the target's average scores against every brand at once
+        target = self._brand_positions[target_brand]
+        func_diffs = np.abs(self._brand_functionality[target] - self._brand_functionality)
+        fashion_diffs = np.abs(self._brand_fashion[target] - self._brand_fashion)
+        within_tolerance = (func_diffs <= functionality_tolerance) & (fashion_diffs <= fashion_tolerance)
         
+        target_segments = self._brand_segment_sets[target]
         similar_brands = []
         
-        for brand in self.get_all_brands():
-            if brand == target_brand:
-                continue
-                
-            brand_info = self.get_brand_segments(brand)
-            if not brand_info:
+        for i in np.flatnonzero(within_tolerance):
+            if i == target:
                 continue
             
-            # Calculate average scores for comparison brand
-            brand_func_avg = sum(s.functionality_score for s in brand_info.segments) / len(brand_info.segments)
-            brand_fashion_avg = sum(s.fashion_score for s in brand_info.segments) / len(brand_info.segments)
+            # Calculate shared segments
+            brand_segments = self._brand_segment_sets[i]
+            shared_segments = target_segments.intersection(brand_segments)
             
-            # Check if within tolerance
-            func_diff = abs(target_func_avg - brand_func_avg)
-            fashion_diff = abs(target_fashion_avg - brand_fashion_avg)
+            similarity_score = len(shared_segments) / len(target_segments.union(brand_segments))
             
-            if func_diff <= functionality_tolerance and fashion_diff <= fashion_tolerance:
-                # Calculate shared segments
-                target_segments = set(s.segment_name for s in target_info.segments)
-                brand_segments = set(s.segment_name for s in brand_info.segments)
-                shared_segments = target_segments.intersection(brand_segments)
-                
-                similarity_score = len(shared_segments) / len(target_segments.union(brand_segments))
-                
-                similar_brands.append({
-                    'brand': brand,
-                    'functionality_score': brand_func_avg,
-                    'fashion_score': brand_fashion_avg,
-                    'functionality_difference': func_diff,
-                    'fashion_difference': fashion_diff,
-                    'shared_segments': list(shared_segments),
-                    'similarity_score': similarity_score
-                })
+            similar_brands.append({
+                'brand': self._brand_names[i],
+                'functionality_score': float(self._brand_functionality[i]),
+                'fashion_score': float(self._brand_fashion[i]),
+                'functionality_difference': float(func_diffs[i]),
+                'fashion_difference': float(fashion_diffs[i]),
+                'shared_segments': list(shared_segments),
+                'similarity_score': similarity_score
+            })
         
         # Sort by similarity score (highest first)
         similar_brands.sort(key=lambda x: x['similarity_score'], reverse=True)
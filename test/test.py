@@ -8,6 +8,7 @@ import sys
 import os
 import json
 import shutil
+import dataclasses
 from pathlib import Path
 
 # Add parent directory to path to import our modules
@@ -35,6 +36,29 @@ class TestCostEstimation:
         assert 'Asian_Production' in analysis.geographical_scenarios
         assert 'Hybrid_Model' in analysis.geographical_scenarios
     
+    def test_cost_assumptions_not_shared(self):
+        """Test that editing one analysis' cost assumptions leaves other analyses untouched"""
+        analysis = MonteCarloCostAnalysis(n_simulations=1000)
+        product_name = next(iter(analysis.cost_assumptions))
+        analysis.cost_assumptions[product_name]['complexity_factor'] = -1
+        assert MonteCarloCostAnalysis(n_simulations=1000).cost_assumptions[product_name].get('complexity_factor') != -1
+    
+    def test_edited_assumptions_recompiled(self, tmp_path):
+        """Test that editing cost assumptions after construction changes the samples and their cache entries"""
+        product_name = 'Hydrotex Moisture-Control Liners'
+        analysis = MonteCarloCostAnalysis(n_simulations=2000, seed=42, cache_dir=tmp_path)
+        before = np.mean(analysis.get_fixed_costs(product_name))
+
+        analysis.cost_assumptions[product_name]['fixed_components']['membrane_rd']['base'] = 4e6
+        after = np.mean(analysis.get_fixed_costs(product_name))
+        assert after > before + 3e6
+
+        # The edited assumptions key their own cache entry, whose samples match a fresh run
+        fresh = MonteCarloCostAnalysis(n_simulations=2000, seed=42)
+        fresh.cost_assumptions[product_name]['fixed_components']['membrane_rd']['base'] = 4e6
+        assert len(list(tmp_path.glob('fixed_*.npy'))) == 2
+        assert np.array_equal(analysis.get_fixed_costs(product_name), fresh.get_fixed_costs(product_name))
+    
     def test_load_products(self):
         """Test loading products from JSON"""
         analysis = MonteCarloCostAnalysis()
@@ -48,7 +72,7 @@ class TestCostEstimation:
         """Test cost calculation for a product"""
         analysis = MonteCarloCostAnalysis(n_simulations=100)
         # Note: load_products returns list but doesn't set self.products
-        # The calculate_costs method uses self.cost_assumptions directly
+        # calculate_costs samples from plans compiled from self.cost_assumptions
         
         # Test calculation for one product
         product_name = 'Hydrotex Moisture-Control Liners'
@@ -86,6 +110,258 @@ class TestCostEstimation:
         # Asian production should have lower variable costs
         assert np.mean(asian_costs['variable_costs']) < np.mean(eu_costs['variable_costs'])
 
+    def test_scenarios_registered_after_init(self):
+        """Test that scenarios added or edited after construction are analyzed with their own multipliers"""
+        analysis = MonteCarloCostAnalysis(n_simulations=500, seed=42)
+        analysis.geographical_scenarios['Nearshore'] = dict(
+            analysis.geographical_scenarios['Hybrid_Model'], labor_cost_multiplier=0.4, description='Nearshore production'
+        )
+        analysis.geographical_scenarios['EU_Production']['labor_cost_multiplier'] = 2.0
+        analysis.run_analysis()
+
+        baseline = MonteCarloCostAnalysis(n_simulations=500, seed=42)
+        baseline.run_analysis()
+        product_name = 'EcoMesh Ventilation Panels'
+        assert 'Nearshore' in analysis.results
+        assert (analysis.results['EU_Production']['products'][product_name]['variable_costs']['mean']
+                > baseline.results['EU_Production']['products'][product_name]['variable_costs']['mean'])
+
+    def test_fixed_costs_shared_across_scenarios(self):
+        """Test that scenario-independent R&D costs are sampled once per product"""
+        analysis = MonteCarloCostAnalysis(n_simulations=500, seed=42)
+        product_name = 'Auto-Tension Drawstrings'
+
+        eu_costs = analysis.calculate_costs(
+            product_name, 'EU_Production', analysis.geographical_scenarios['EU_Production']
+        )
+        hybrid_costs = analysis.calculate_costs(
+            product_name, 'Hybrid_Model', analysis.geographical_scenarios['Hybrid_Model']
+        )
+
+        assert eu_costs['fixed_costs'] is hybrid_costs['fixed_costs']
+        assert not np.array_equal(eu_costs['variable_costs'], hybrid_costs['variable_costs'])
+
+    def test_seeded_costs_memoized(self):
+        """Test that seeded runs reuse variable cost samples for a repeated (product, scenario)"""
+        analysis = MonteCarloCostAnalysis(n_simulations=500, seed=42)
+        scenario_params = analysis.geographical_scenarios['Asian_Production']
+        first = analysis.calculate_costs('MacronLock Magnetic Closures', 'Asian_Production', scenario_params)
+        second = analysis.calculate_costs('MacronLock Magnetic Closures', 'Asian_Production', scenario_params)
+        assert first['variable_costs'] is second['variable_costs']
+        assert not first['variable_costs'].flags.writeable
+
+        # The memoized samples are those of a fresh seeded run, even after other calls on the stream
+        history = MonteCarloCostAnalysis(n_simulations=500, seed=42)
+        history.calculate_costs('MacronLock Magnetic Closures', 'Asian_Production', dict(scenario_params))
+        memoized = history.calculate_costs(
+            'MacronLock Magnetic Closures', 'Asian_Production', history.geographical_scenarios['Asian_Production']
+        )
+        assert np.array_equal(memoized['variable_costs'], first['variable_costs'])
+
+        # Scenarios unknown at construction get name-derived streams, also independent of call history
+        nearshore = dict(scenario_params, labor_cost_multiplier=0.4)
+        history.calculate_costs('MacronLock Magnetic Closures', 'Offshore', dict(scenario_params))
+        late = history.calculate_costs('MacronLock Magnetic Closures', 'Nearshore', nearshore)
+        fresh = MonteCarloCostAnalysis(n_simulations=500, seed=42)
+        assert np.array_equal(
+            late['variable_costs'],
+            fresh.calculate_costs('MacronLock Magnetic Closures', 'Nearshore', nearshore)['variable_costs']
+        )
+
+        # Editing a scenario's multipliers is not served from the memo
+        scenario_params['labor_cost_multiplier'] = 1.0
+        edited = analysis.calculate_costs('MacronLock Magnetic Closures', 'Asian_Production', scenario_params)
+        assert np.mean(edited['variable_costs']) > np.mean(first['variable_costs'])
+
+        # Unseeded runs keep drawing fresh samples
+        analysis = MonteCarloCostAnalysis(n_simulations=500)
+        first = analysis.calculate_costs('MacronLock Magnetic Closures', 'Asian_Production', scenario_params)
+        second = analysis.calculate_costs('MacronLock Magnetic Closures', 'Asian_Production', scenario_params)
+        assert not np.array_equal(first['variable_costs'], second['variable_costs'])
+
+    def test_common_random_numbers(self):
+        """Test that common random numbers correlate a product's costs across scenarios"""
+        product_name = 'Hydrotex Moisture-Control Liners'
+        correlations = {}
+        for common_random_numbers in (False, True):
+            analysis = MonteCarloCostAnalysis(n_simulations=2000, seed=42, common_random_numbers=common_random_numbers)
+            eu_costs = analysis.calculate_costs(
+                product_name, 'EU_Production', analysis.geographical_scenarios['EU_Production']
+            )
+            asian_costs = analysis.calculate_costs(
+                product_name, 'Asian_Production', analysis.geographical_scenarios['Asian_Production']
+            )
+            correlations[common_random_numbers] = np.corrcoef(eu_costs['variable_costs'], asian_costs['variable_costs'])[0, 1]
+
+        assert abs(correlations[False]) < 0.1
+        assert correlations[True] > 0.9
+
+        # Inverse-CDF modes replay the same stratified points in every scenario
+        analysis = MonteCarloCostAnalysis(n_simulations=1000, seed=42, sampling='lhs', common_random_numbers=True)
+        eu_costs = analysis.calculate_costs(
+            product_name, 'EU_Production', analysis.geographical_scenarios['EU_Production']
+        )
+        asian_costs = analysis.calculate_costs(
+            product_name, 'Asian_Production', analysis.geographical_scenarios['Asian_Production']
+        )
+        assert np.corrcoef(eu_costs['variable_costs'], asian_costs['variable_costs'])[0, 1] > 0.9
+
+    def test_persistent_sample_cache(self, tmp_path):
+        """Test that seeded samples are persisted and reloaded instead of re-simulated"""
+        product_name = 'Phase Change Material (PCM) Inserts'
+        analysis = MonteCarloCostAnalysis(n_simulations=500, seed=42, cache_dir=tmp_path)
+        costs = analysis.calculate_costs(
+            product_name, 'EU_Production', analysis.geographical_scenarios['EU_Production']
+        )
+        assert len(list(tmp_path.glob('*.npy'))) == 2
+
+        repeat = MonteCarloCostAnalysis(n_simulations=500, seed=42, cache_dir=tmp_path)
+        with patch.object(repeat, '_sample_fixed', side_effect=AssertionError), \
+             patch.object(repeat, '_sample_variable', side_effect=AssertionError):
+            cached = repeat.calculate_costs(
+                product_name, 'EU_Production', repeat.geographical_scenarios['EU_Production']
+            )
+        assert np.array_equal(costs['fixed_costs'], cached['fixed_costs'])
+        assert np.array_equal(costs['variable_costs'], cached['variable_costs'])
+
+        # The cache entry is the fresh seeded sample, whatever the writer drew from the stream first
+        fresh = MonteCarloCostAnalysis(n_simulations=500, seed=42)
+        history_dir = tmp_path / 'history'
+        history = MonteCarloCostAnalysis(n_simulations=500, seed=42, cache_dir=history_dir)
+        history.calculate_costs(product_name, 'EU_Production', dict(history.geographical_scenarios['EU_Production']))
+        history.calculate_costs(product_name, 'EU_Production', history.geographical_scenarios['EU_Production'])
+        cached_variable = [np.load(path) for path in history_dir.glob('variable_*.npy')]
+        assert len(cached_variable) == 1
+        assert np.array_equal(cached_variable[0], fresh.calculate_costs(
+            product_name, 'EU_Production', fresh.geographical_scenarios['EU_Production']
+        )['variable_costs'])
+
+        # A different seed is a different cache entry
+        other_seed = MonteCarloCostAnalysis(n_simulations=500, seed=7, cache_dir=tmp_path)
+        other_seed.calculate_costs(product_name, 'EU_Production', other_seed.geographical_scenarios['EU_Production'])
+        assert len(list(tmp_path.glob('*.npy'))) == 4
+
+    def test_compact_json_export(self, tmp_path):
+        """Test that compact JSON output holds the same data as the indented default"""
+        data = {'metadata': {'simulations': 500}, 'means': np.array([1.5, 2.5]), 'total': np.float32(4.0)}
+        MonteCarloCostAnalysis(n_simulations=500)._write_json(tmp_path / 'indented.json', data)
+        MonteCarloCostAnalysis(n_simulations=500, compact_json=True)._write_json(tmp_path / 'compact.json', data)
+
+        indented = (tmp_path / 'indented.json').read_text()
+        compact = (tmp_path / 'compact.json').read_text()
+        assert '\n' not in compact and len(compact) < len(indented)
+        assert json.loads(compact) == json.loads(indented)
+
+    def test_outputs_share_run_timestamp(self, tmp_path, monkeypatch):
+        """Test that the files written for one analysis run carry the run's timestamp"""
+        monkeypatch.setattr('cost_estimation.RESULTS_DIR', tmp_path)
+        analysis = MonteCarloCostAnalysis(n_simulations=500, seed=42)
+        analysis.run_analysis()
+        analysis_file = analysis.export_results()
+        summary_file = analysis.generate_executive_summary()
+
+        assert analysis_file.name == f"analysis_{analysis.run_timestamp}.json"
+        assert summary_file.name == f"executive_summary_{analysis.run_timestamp}.json"
+        assert json.loads(summary_file.read_text())['metadata']['timestamp'] == analysis.run_timestamp
+
+    def test_sobol_sampling(self):
+        """Test quasi-Monte Carlo sampling with scrambled Sobol points"""
+        with pytest.raises(ValueError):
+            MonteCarloCostAnalysis(n_simulations=1000, sampling='sobol')
+
+        analysis = MonteCarloCostAnalysis(n_simulations=1024, seed=42, sampling='sobol')
+        costs = analysis.calculate_costs(
+            'HD Bonded Insulation Pads',
+            'EU_Production',
+            analysis.geographical_scenarios['EU_Production']
+        )
+
+        assert len(costs['fixed_costs']) == 1024
+        assert len(costs['variable_costs']) == 1024
+        assert np.all(costs['fixed_costs'] > 0)
+        assert np.all(np.isfinite(costs['variable_costs']))
+
+        # Same seed must reproduce the same scrambled points
+        repeat = MonteCarloCostAnalysis(n_simulations=1024, seed=42, sampling='sobol').calculate_costs(
+            'HD Bonded Insulation Pads',
+            'EU_Production',
+            analysis.geographical_scenarios['EU_Production']
+        )
+        assert np.array_equal(costs['fixed_costs'], repeat['fixed_costs'])
+
+    def test_latin_hypercube_sampling(self):
+        """Test Latin Hypercube sampling with a non power-of-two sample size"""
+        analysis = MonteCarloCostAnalysis(n_simulations=1000, seed=42, sampling='lhs')
+        costs = analysis.calculate_costs(
+            'Performance Jacquard Reinforcement',
+            'Asian_Production',
+            analysis.geographical_scenarios['Asian_Production']
+        )
+
+        assert len(costs['fixed_costs']) == 1000
+        assert np.all(costs['fixed_costs'] > 0)
+        assert np.all(np.isfinite(costs['variable_costs']))
+
+    def test_batched_simulation(self):
+        """Test that batched simulation fills every draw, including a partial last batch"""
+        analysis = MonteCarloCostAnalysis(n_simulations=1000, seed=42, batch_size=300)
+        costs = analysis.calculate_costs(
+            'EcoMesh Ventilation Panels',
+            'EU_Production',
+            analysis.geographical_scenarios['EU_Production']
+        )
+
+        assert len(costs['fixed_costs']) == 1000
+        assert len(costs['variable_costs']) == 1000
+        assert np.all(costs['fixed_costs'] > 0)
+        assert np.all(costs['variable_costs'] > 0)
+
+    def test_streaming_variable_cost_statistics(self):
+        """Test that streamed statistics match those of the materialized samples"""
+        product_name = 'Bio-Based Water Repellents'
+        scenario_params = MonteCarloCostAnalysis().geographical_scenarios['Hybrid_Model']
+        costs = MonteCarloCostAnalysis(n_simulations=1000, seed=42, batch_size=300).calculate_costs(
+            product_name, 'Hybrid_Model', scenario_params
+        )['variable_costs'].astype(np.float64)
+        stats = MonteCarloCostAnalysis(n_simulations=1000, seed=42, batch_size=300).variable_cost_statistics(
+            product_name, 'Hybrid_Model', scenario_params
+        )
+
+        assert stats['mean'] == pytest.approx(np.mean(costs))
+        assert stats['std'] == pytest.approx(np.std(costs))
+        assert stats['p5'] == pytest.approx(np.percentile(costs, 5))
+        assert stats['p95'] == pytest.approx(np.percentile(costs, 95))
+
+        # A statistics pass leaves the streams behind calculate_costs untouched, seeded or not
+        for seed in (42, None):
+            analysis = MonteCarloCostAnalysis(n_simulations=1000, seed=seed, batch_size=300)
+            rngs_before = {key: repr(rng.bit_generator.state) for key, rng in analysis._rngs.items()}
+            analysis.variable_cost_statistics(product_name, 'Hybrid_Model', scenario_params)
+            analysis.variable_cost_statistics(product_name, 'Ad_Hoc', dict(scenario_params))
+            assert {key: repr(rng.bit_generator.state) for key, rng in analysis._rngs.items()} == rngs_before
+
+    def test_parallel_analysis_matches_serial(self):
+        """Test that running jobs on a process pool reproduces the serial results"""
+        serial = MonteCarloCostAnalysis(n_simulations=200, seed=42)
+        serial.run_analysis()
+        parallel = MonteCarloCostAnalysis(n_simulations=200, seed=42)
+        parallel.run_analysis(n_jobs=2)
+
+        for scenario_name, results in serial.results.items():
+            assert results['products'] == parallel.results[scenario_name]['products']
+            assert results['portfolio_summary'] == parallel.results[scenario_name]['portfolio_summary']
+
+        # Unseeded pool runs draw fresh samples every run, and fixed costs are sampled once per product
+        unseeded = MonteCarloCostAnalysis(n_simulations=200)
+        with patch.object(MonteCarloCostAnalysis, '_simulate_fixed', autospec=True,
+                          side_effect=MonteCarloCostAnalysis._simulate_fixed) as simulate_fixed:
+            unseeded.run_analysis(n_jobs=2)
+        assert simulate_fixed.call_count == len(unseeded.cost_assumptions)
+        product_name = 'Hydrotex Moisture-Control Liners'
+        first_mean = unseeded.results['EU_Production']['products'][product_name]['variable_costs']['mean']
+        unseeded.run_analysis(n_jobs=2)
+        assert unseeded.results['EU_Production']['products'][product_name]['variable_costs']['mean'] != first_mean
+
 class TestBrandIntelligence:
     """Test the brand intelligence module"""
     
@@ -165,6 +441,22 @@ class TestItalianFashionMarket:
         assert len(brand_info.segments) > 0
         assert any('Luxury' in seg.segment_name for seg in brand_info.segments)
 
+        # Segment characteristics are shared by every query, so they cannot be modified
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            brand_info.segments[0].fashion_score = 0.0
+
+    def test_find_similar_brands(self):
+        """Test finding brands with similar segment positioning"""
+        market = ItalianFashionMarket()
+        similar = market.find_similar_brands('Macron', functionality_tolerance=0.3, fashion_tolerance=0.3)
+
+        assert len(similar) > 0
+        assert all(s['brand'] != 'Macron' for s in similar)
+        assert all(s['functionality_difference'] <= 0.3 and s['fashion_difference'] <= 0.3 for s in similar)
+        scores = [s['similarity_score'] for s in similar]
+        assert scores == sorted(scores, reverse=True)
+        assert market.find_similar_brands('Unknown Brand') == []
+
 class TestSimulation:
     """Test the simulation module"""
     
@@ -8,15 +8,18 @@ partnership dynamics, and strategic insights.
 import json
 import numpy as np
 import matplotlib.pyplot as plt
-import seaborn as sns
+from matplotlib import cycler
 from pathlib import Path
 from datetime import datetime
 import pandas as pd
 from typing import Dict, List, Any
 
+# Seaborn's default six-colour "husl" palette, spelled out so seaborn isn't imported just for a colour cycle
+HUSL_PALETTE = ('#f77189', '#bb9832', '#50b131', '#36ada4', '#3ba3ec', '#e866f4')
+
 # Set style
 plt.style.use('seaborn-v0_8-darkgrid')
-sns.set_palette("husl")
+plt.rcParams['axes.prop_cycle'] = cycler(color=HUSL_PALETTE)
 
 class SimulationVisualizer:
     def __init__(self, analysis_file: str = None):